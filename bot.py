@@ -519,6 +519,38 @@ async def _send_discord_message(discord_id, message):
 def send_discord_message(discord_id, message):
     return asyncio.run_coroutine_threadsafe(_send_discord_message(discord_id, message), bot.loop)
 
+DISCORD_MESSAGE_LIMIT = 2000
+
+def build_digest_chunks(messages, limit=DISCORD_MESSAGE_LIMIT):
+    # Join reminders into as few Discord-sized messages as possible
+    chunks = []
+    current = ""
+    for message in messages:
+        # A single reminder longer than the limit gets hard-split
+        while len(message) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(message[:limit])
+            message = message[limit:]
+        if not message:
+            continue
+        if current and len(current) + 2 + len(message) <= limit:
+            current += "\n\n" + message
+        else:
+            if current:
+                chunks.append(current)
+            current = message
+    if current:
+        chunks.append(current)
+    return chunks
+
+def flush_event_digests(digests):
+    # digests: {discord_id or None (event channel): [messages]}
+    for discord_id, messages in digests.items():
+        for chunk in build_digest_chunks(messages):
+            send_discord_message(discord_id, chunk)
+
 def check_events():
     global calendar, sent_notifications
     if not calendar:
@@ -529,6 +561,10 @@ def check_events():
     upcoming = now + timedelta(minutes=5)
     margin = timedelta(seconds=30)
 
+    # Reminders due in this window are coalesced into one digest per recipient
+    digests = {}
+    new_keys = []
+
     for event in calendar.events():
         try:
             vevent = event.vobject_instance.vevent
@@ -581,17 +617,26 @@ def check_events():
                                 print(f"[DEBUG][Event] Error fetching Discord ID for {email}: {e}")
                             participants.append(discord_id)
 
-                    for discord_id in participants:
-                        if discord_id:
-                            send_discord_message(discord_id, message)
-                    send_discord_message(None, message)
+                    recipients = [discord_id for discord_id in participants if discord_id]
+                    recipients.append(None)
+                    for discord_id in recipients:
+                        queued = digests.setdefault(discord_id, [])
+                        # An event start and its VALARMs can share a window; list it once
+                        if message not in queued:
+                            queued.append(message)
 
-                    sent_notifications.add(notification_key)
-                    save_sent_notifications()
+                    new_keys.append(notification_key)
 
         except Exception as e:
             print(f"[DEBUG][Event] Exception while processing event: {e}")
 
+    if not new_keys:
+        return
+
+    flush_event_digests(digests)
+    sent_notifications.update(new_keys)
+    save_sent_notifications()
+
 # -----------------------------
 # Nextcloud calendar setup
 # -----------------------------